@@ -1,10 +1,16 @@
 import argparse
 import base64
+import gzip
+import hashlib
 import html as html_module
 import io
 import json
 import os
 import re
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from string import Template
 
 import matplotlib
@@ -24,29 +30,277 @@ plt.rcParams.update(
     }
 )
 
+# Resolved next to the HTML output so builds don't depend on the working directory.
+_DATASET_CACHE_SUBDIR = os.path.join(".cache", "dashboard")
+# Bump whenever the payload produced by _render_dataset changes shape or content.
+_DATASET_CACHE_VERSION = 6
+# Least recently used entries beyond this many are pruned after each build.
+_DATASET_CACHE_MAX_ENTRIES = 32
+CHART_FORMATS = ("svg", "webp", "png")
+_MAX_CHART_POINTS = 2000
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
 
-def _to_png_b64(fig):
+
+_raster_figure = None
+
+
+def _raster_axes():
+    # One Figure is reused for every raster chart; clearing it is much cheaper
+    # than building and tearing down a new Figure/canvas per chart.
+    global _raster_figure
+    if _raster_figure is None:
+        _raster_figure = plt.figure()
+    _raster_figure.clear()
+    return _raster_figure, _raster_figure.add_subplot()
+
+
+@lru_cache(maxsize=None)
+def _webp_supported():
+    from PIL import features
+
+    return bool(features.check("webp"))
+
+
+def _to_raster_b64(fig, fmt="webp"):
+    if fmt == "webp" and not _webp_supported():
+        fmt = "png"
     buf = io.BytesIO()
-    fig.savefig(buf, format="png", bbox_inches="tight", dpi=150)
-    plt.close(fig)
-    buf.seek(0)
-    return "data:image/png;base64," + base64.b64encode(buf.read()).decode("ascii")
+    if fmt == "webp":
+        save_kwargs = {"pil_kwargs": {"quality": 85, "method": 4}}
+    else:
+        save_kwargs = {
+            "metadata": {"Software": None},
+            "pil_kwargs": {"optimize": False, "compress_level": 1},
+        }
+    fig.savefig(buf, format=fmt, bbox_inches="tight", dpi=150, **save_kwargs)
+    return f"data:image/{fmt};base64," + base64.b64encode(buf.getbuffer()).decode("ascii")
+
+
+def _to_raster_linechart(fmt, x, y, roll_x, roll_y, title, xlabel, ylabel):
+    fig, ax = _raster_axes()
+    ax.plot(x, y, marker="o", linestyle="-")
+    if roll_x is not None:
+        ax.plot(roll_x, roll_y, linestyle="--")
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.grid(True, alpha=0.3)
+    return _to_raster_b64(fig, fmt)
+
+
+def _to_raster_scatter(fmt, x, y, title, xlabel, ylabel):
+    fig, ax = _raster_axes()
+    ax.scatter(x, y)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.grid(True, alpha=0.3)
+    return _to_raster_b64(fig, fmt)
+
+
+def _svg_values(values):
+    if values is None:
+        return np.array([], dtype=float), False
+    if isinstance(values, (pd.Series, pd.Index)) and pd.api.types.is_datetime64_any_dtype(values.dtype):
+        stamps = pd.DatetimeIndex(values).as_unit("ns")
+        out = stamps.asi8.astype(float)
+        out[stamps.isna()] = np.nan
+        return out, True
+    return pd.to_numeric(pd.Series(np.asarray(values)), errors="coerce").to_numpy(dtype=float), False
+
+
+def _svg_range(*arrays, flat_pad=None):
+    finite = [a[np.isfinite(a)] for a in arrays if a.size]
+    finite = [a for a in finite if a.size]
+    if not finite:
+        return 0.0, 1.0
+    lo = min(float(a.min()) for a in finite)
+    hi = max(float(a.max()) for a in finite)
+    if lo == hi:
+        pad = flat_pad or abs(lo) * 0.05 or 0.5
+        return lo - pad, hi + pad
+    pad = (hi - lo) * 0.05
+    return lo - pad, hi + pad
+
+
+_SECOND_NS = 10**9
+_DAY_NS = 86_400 * _SECOND_NS
+# Fixed-width date tick steps (in seconds) for spans up to a few weeks.
+_DATE_STEPS_S = (1, 2, 5, 10, 15, 30, 60, 120, 300, 600, 900, 1800, 3600, 2 * 3600, 3 * 3600,
+                 6 * 3600, 12 * 3600, 86_400, 2 * 86_400, 4 * 86_400, 7 * 86_400, 14 * 86_400)
+
+
+def _svg_ticks(lo, hi, is_datetime, target=5):
+    # Returns (position, label) pairs; label precision follows the tick step so
+    # narrow ranges (e.g. survival 0.996-0.999) still get distinct labels.
+    if is_datetime:
+        return _svg_date_ticks(lo, hi, target)
+    raw_step = (hi - lo) / target
+    magnitude = 10 ** np.floor(np.log10(raw_step))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw_step)
+    decimals = max(0, -int(np.floor(np.log10(step))))
+    while decimals < 12 and abs(round(step * 10**decimals) - step * 10**decimals) > 1e-6:
+        decimals += 1
+    values = np.arange(np.ceil(lo / step) * step, hi + step * 1e-9, step)
+    return [(v, f"{round(v, decimals) + 0.0:,.{decimals}f}") for v in values]
+
+
+def _svg_date_ticks(lo, hi, target):
+    raw_step = (hi - lo) / target
+    for step_s in _DATE_STEPS_S:
+        step = step_s * _SECOND_NS
+        if step >= raw_step:
+            if step >= _DAY_NS:
+                date_format = "%Y-%m-%d"
+            elif step >= 60 * _SECOND_NS:
+                date_format = "%Y-%m-%d %H:%M"
+            else:
+                date_format = "%Y-%m-%d %H:%M:%S"
+            values = np.arange(np.ceil(lo / step) * step, hi + 1, step)
+            return [(v, pd.Timestamp(int(v), tz="UTC").strftime(date_format)) for v in values]
+
+    # Longer spans: align to calendar month or year starts.
+    start = pd.Timestamp(int(lo), tz="UTC")
+    end = pd.Timestamp(int(hi), tz="UTC")
+    candidates = [(f"{n}MS", "%Y-%m") for n in (1, 2, 3, 6)]
+    candidates += [(f"{n}YS", "%Y") for n in (1, 2, 5, 10, 20, 50, 100)]
+    for freq, date_format in candidates:
+        stamps = pd.date_range(start.ceil("D"), end, freq=freq)
+        if len(stamps) <= target + 2:
+            break
+    values = stamps.as_unit("ns").asi8.astype(float)
+    return [(v, stamp.strftime(date_format)) for v, stamp in zip(values, stamps)]
+
+
+def _svg_path(px, py, markers_only=False):
+    parts = []
+    pen_down = False
+    for xv, yv in zip(px, py):
+        if not (np.isfinite(xv) and np.isfinite(yv)):
+            pen_down = False
+            continue
+        if markers_only:
+            parts.append(f"M{xv:.1f} {yv:.1f}h0")
+        else:
+            parts.append(f"{'L' if pen_down else 'M'}{xv:.1f} {yv:.1f}")
+            pen_down = True
+    return "".join(parts)
+
+
+# Each series is (x, y, style) with style "line" (solid + markers), "dashed" or "points".
+def _to_svg_chart(series, title, xlabel, ylabel, width=1200, height=450):
+    left, right, top, bottom = 80, 20, 40, 60
+    plot_w = width - left - right
+    plot_h = height - top - bottom
+
+    mapped = [(_svg_values(x), _svg_values(y)[0], style) for x, y, style in series]
+    is_datetime = any(x_is_dt for (_, x_is_dt), _, _ in mapped)
+    xmin, xmax = _svg_range(*(xv for (xv, _), _, _ in mapped), flat_pad=_DAY_NS / 2 if is_datetime else None)
+    ymin, ymax = _svg_range(*(yv for _, yv, _ in mapped))
+
+    def sx(v):
+        return left + (v - xmin) / (xmax - xmin) * plot_w
+
+    def sy(v):
+        return top + plot_h - (v - ymin) / (ymax - ymin) * plot_h
+
+    # Tick labels are generated numbers/dates; only the caller-supplied text needs escaping.
+    title, xlabel, ylabel = (html_module.escape(text) for text in (title, xlabel, ylabel))
+    out = [
+        f'<svg class="chart" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" role="img" aria-label="{title}">',
+        f"<title>{title}</title>",
+        f'<text x="{left + plot_w / 2:.0f}" y="24" text-anchor="middle" font-size="16">{title}</text>',
+    ]
+    for v, label in _svg_ticks(ymin, ymax, False):
+        y = sy(v)
+        out.append(f'<line x1="{left}" x2="{left + plot_w}" y1="{y:.1f}" y2="{y:.1f}" stroke="#000" stroke-opacity="0.1" />')
+        out.append(f'<text x="{left - 6}" y="{y + 4:.1f}" text-anchor="end" font-size="11">{label}</text>')
+    for v, label in _svg_ticks(xmin, xmax, is_datetime):
+        x = sx(v)
+        out.append(f'<line x1="{x:.1f}" x2="{x:.1f}" y1="{top}" y2="{top + plot_h}" stroke="#000" stroke-opacity="0.1" />')
+        out.append(f'<text x="{x:.1f}" y="{top + plot_h + 18}" text-anchor="middle" font-size="11">{label}</text>')
+    out.append(f'<rect x="{left}" y="{top}" width="{plot_w}" height="{plot_h}" fill="none" stroke="#333" />')
+    out.append(f'<text x="{left + plot_w / 2:.0f}" y="{height - 12}" text-anchor="middle" font-size="13">{xlabel}</text>')
+    out.append(
+        f'<text x="18" y="{top + plot_h / 2:.0f}" text-anchor="middle" font-size="13" '
+        f'transform="rotate(-90 18 {top + plot_h / 2:.0f})">{ylabel}</text>'
+    )
+
+    colors = ["#1f77b4", "#ff7f0e", "#2ca02c"]
+    for index, ((xv, _), yv, style) in enumerate(mapped):
+        color = colors[index % len(colors)]
+        px, py = sx(xv), sy(yv)
+        if style in ("line", "dashed"):
+            dash = ' stroke-dasharray="8 5"' if style == "dashed" else ""
+            out.append(f'<path d="{_svg_path(px, py)}" fill="none" stroke="{color}" stroke-width="1.5"{dash} />')
+        if style in ("line", "points"):
+            size = 6 if style == "line" else 8
+            out.append(
+                f'<path d="{_svg_path(px, py, markers_only=True)}" fill="none" stroke="{color}" '
+                f'stroke-width="{size}" stroke-linecap="round" />'
+            )
+    out.append("</svg>")
+    return "".join(out)
+
+
+def _to_svg_linechart(x, y, roll_x, roll_y, title, xlabel, ylabel):
+    series = [(x, y, "line")]
+    if roll_x is not None:
+        series.append((roll_x, roll_y, "dashed"))
+    return _to_svg_chart(series, title, xlabel, ylabel)
+
+
+def _to_svg_scatter(x, y, title, xlabel, ylabel):
+    return _to_svg_chart([(x, y, "points")], title, xlabel, ylabel)
+
+
+def _img_tag(data_uri, alt):
+    return f'<img class="chart" src="{data_uri}" alt="{html_module.escape(alt)}" />'
+
+
+def _take(values, idx):
+    return values.iloc[idx] if isinstance(values, pd.Series) else values[idx]
+
+
+def _downsample(x, y, n=_MAX_CHART_POINTS):
+    # Evenly strided subsample: keeps the first/last points and the x-range,
+    # while capping how many markers and segments a chart has to draw.
+    if x is None or len(x) <= n:
+        return x, y
+    idx = np.linspace(0, len(x) - 1, n).astype(np.int64)
+    return _take(x, idx), _take(y, idx)
+
+
+def _render_linechart(chart_format, x, y, roll_x, roll_y, title, xlabel, ylabel):
+    x, y = _downsample(x, y)
+    roll_x, roll_y = _downsample(roll_x, roll_y)
+    if chart_format == "svg":
+        return _to_svg_linechart(x, y, roll_x, roll_y, title, xlabel, ylabel)
+    return _img_tag(_to_raster_linechart(chart_format, x, y, roll_x, roll_y, title, xlabel, ylabel), title)
+
+
+def _render_scatter(chart_format, x, y, title, xlabel, ylabel):
+    x, y = _downsample(x, y)
+    if chart_format == "svg":
+        return _to_svg_scatter(x, y, title, xlabel, ylabel)
+    return _img_tag(_to_raster_scatter(chart_format, x, y, title, xlabel, ylabel), title)
 
 
 def _slugify(value):
-    slug = re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+    slug = _SLUG_RE.sub("-", value.lower()).strip("-")
     return slug or "repo"
 
 
-def _unique_id(base, used, seed):
+def _unique_id(base, used, counters, seed):
     candidate = base or f"repo-{seed}"
-    if candidate not in used:
-        used.add(candidate)
-        return candidate
-    index = 2
-    while f"{candidate}-{index}" in used:
-        index += 1
-    final = f"{candidate}-{index}"
+    # counters remembers the next suffix per base, so repeated slugs don't rescan
+    # from -2; the loop only advances past ids some other base already claimed.
+    n = counters[candidate]
+    final = candidate if n == 0 else f"{candidate}-{n + 1}"
+    while final in used:
+        n += 1
+        final = f"{candidate}-{n + 1}"
+    counters[candidate] = n + 1
     used.add(final)
     return final
 
@@ -62,6 +316,18 @@ def _format_float(value):
     return f"{float(value):.3f}"
 
 
+def _fmt3(values):
+    # Column-at-a-time equivalent of _format_float: "%.3f", blank for NaN.
+    # tolist() yields plain floats, so the comprehension avoids per-element
+    # numpy scalar overhead (np.char.mod is a Python-level loop as well).
+    return ["" if v != v else f"{v:.3f}" for v in values.to_numpy(dtype=float, na_value=np.nan).tolist()]
+
+
+def _finite_mean(values):
+    finite = values[np.isfinite(values)]
+    return float(finite.mean()) if finite.size else float("nan")
+
+
 def _normalize_dataset_specs(default_csv, datasets):
     if datasets:
         specs = []
@@ -79,11 +345,109 @@ def _normalize_dataset_specs(default_csv, datasets):
     return [(display_name, default_csv)]
 
 
-def _prepare_dataset(label, csv_path):
+def _dataset_cache_path(cache_dir, csv_path, chart_format):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{_DATASET_CACHE_VERSION}:{chart_format}:".encode("ascii"))
+    with open(csv_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return os.path.join(cache_dir, f"{digest.hexdigest()}.json.gz")
+
+
+def _load_cached_payload(cache_path):
+    try:
+        with gzip.open(cache_path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+        # Refresh mtime so pruning keeps entries that are still in use.
+        os.utime(cache_path)
+        return payload
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError):
+        # Corrupt or truncated entry; fall back to a fresh render.
+        return None
+
+
+def _store_cached_payload(cache_path, payload):
+    # Best effort: an unwritable cache location must never fail the build.
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, cache_path)
+        tmp_path = None
+    except OSError:
+        pass
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def _prune_dataset_cache(cache_dir, keep):
+    try:
+        entries = [entry for entry in os.scandir(cache_dir) if entry.name.endswith(".json.gz")]
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    except OSError:
+        return
+    for entry in entries[keep:]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _lookup_dataset(csv_path, cache_dir, chart_format):
     if not os.path.exists(csv_path):
         raise FileNotFoundError(f"CSV not found: {csv_path}")
+    if not cache_dir:
+        return None, None
+    cache_path = _dataset_cache_path(cache_dir, csv_path, chart_format)
+    return cache_path, _load_cached_payload(cache_path)
+
+
+def _render_and_cache_dataset(csv_path, cache_path, chart_format):
+    payload = _render_dataset(csv_path, chart_format)
+    if cache_path is not None:
+        _store_cached_payload(cache_path, payload)
+    return payload
+
+
+def _labelled_payload(label, csv_path, payload):
+    return {
+        "label": label,
+        "source": os.path.basename(csv_path),
+        **payload,
+    }
+
+
+def _prepare_dataset(label, csv_path, cache_dir=None, chart_format="svg"):
+    cache_path, payload = _lookup_dataset(csv_path, cache_dir, chart_format)
+    if payload is None:
+        payload = _render_and_cache_dataset(csv_path, cache_path, chart_format)
+    return _labelled_payload(label, csv_path, payload)
+
+
+def _read_csv(csv_path):
+    # The multi-threaded Arrow parser is much faster on large exports; columns stay
+    # numpy-backed so the rest of the pipeline is unchanged. pyarrow is optional,
+    # and the default parser remains the reference for files Arrow rejects.
+    try:
+        df = pd.read_csv(csv_path, engine="pyarrow")
+    except (ImportError, ValueError):
+        return pd.read_csv(csv_path)
+    if not df.columns.is_unique:
+        # Arrow keeps duplicate headers as-is; the C parser mangles them to "X.1".
+        return pd.read_csv(csv_path)
+    return df
+
 
-    df = pd.read_csv(csv_path)
+def _render_dataset(csv_path, chart_format):
+    df = _read_csv(csv_path)
     df.columns = [c.strip() for c in df.columns]
     if "Date" not in df.columns:
         raise ValueError("CSV must contain a 'Date' column.")
@@ -101,93 +465,67 @@ def _prepare_dataset(label, csv_path):
     else:
         df["ImmediateReworkRate"] = np.nan
 
-    df["AI_Quality_Index"] = df["SurvivalRate"] * (1 - df["ImmediateReworkRate"].fillna(0))
+    sr = df["SurvivalRate"].to_numpy(dtype=float)
+    ir = df["ImmediateReworkRate"].to_numpy(dtype=float)
+    qi = np.where(np.isnan(ir), 0.0, ir)
+    np.subtract(1.0, qi, out=qi)
+    qi *= sr
+    df["AI_Quality_Index"] = qi
 
     if df["Date"].notna().any():
-        tmp = df.set_index("Date").sort_index()
-        daily = tmp.resample("1D").mean(numeric_only=True)
-        roll_sr = daily["SurvivalRate"].rolling(7, min_periods=1).mean()
-        roll_ir = daily["ImmediateReworkRate"].rolling(7, min_periods=1).mean()
-        roll_qi = daily["AI_Quality_Index"].rolling(7, min_periods=1).mean()
-        x_roll = roll_sr.index
+        # Trailing 7-day window over the commits themselves; df is already sorted
+        # by Date, so this avoids densifying sparse histories into a daily index.
+        trend_cols = ["SurvivalRate", "ImmediateReworkRate", "AI_Quality_Index"]
+        dated = df.loc[df["Date"].notna(), ["Date", *trend_cols]]
+        rolling = dated.rolling("7D", on="Date", min_periods=1).mean()
+        roll_sr = rolling["SurvivalRate"]
+        roll_ir = rolling["ImmediateReworkRate"]
+        roll_qi = rolling["AI_Quality_Index"]
+        x_roll = dated["Date"]
     else:
         roll_sr = roll_ir = roll_qi = None
         x_roll = None
 
-    charts = {}
-
-    fig1 = plt.figure()
-    plt.plot(df["Date"], df["SurvivalRate"], marker="o", linestyle="-")
-    if x_roll is not None:
-        plt.plot(x_roll, roll_sr, linestyle="--")
-    plt.title("Survival Rate over Time")
-    plt.xlabel("Date")
-    plt.ylabel("SurvivalRate (0-1)")
-    plt.grid(True, alpha=0.3)
-    charts["survival"] = _to_png_b64(fig1)
-
-    fig2 = plt.figure()
-    plt.plot(df["Date"], df["ImmediateReworkRate"], marker="o", linestyle="-")
-    if x_roll is not None:
-        plt.plot(x_roll, roll_ir, linestyle="--")
-    plt.title("Immediate Rework Rate over Time")
-    plt.xlabel("Date")
-    plt.ylabel("ImmediateReworkRate (0-1)")
-    plt.grid(True, alpha=0.3)
-    charts["immediate"] = _to_png_b64(fig2)
-
+    charts = {
+        "survival": _render_linechart(
+            chart_format, df["Date"], df["SurvivalRate"], x_roll, roll_sr,
+            "Survival Rate over Time", "Date", "SurvivalRate (0-1)",
+        ),
+        "immediate": _render_linechart(
+            chart_format, df["Date"], df["ImmediateReworkRate"], x_roll, roll_ir,
+            "Immediate Rework Rate over Time", "Date", "ImmediateReworkRate (0-1)",
+        ),
+    }
     if "LinesAdded" in df.columns:
-        fig3 = plt.figure()
-        plt.scatter(df["LinesAdded"], df["SurvivalRate"])
-        plt.title("Churn Correlation: LinesAdded vs SurvivalRate")
-        plt.xlabel("LinesAdded per Commit")
-        plt.ylabel("SurvivalRate (0-1)")
-        plt.grid(True, alpha=0.3)
-        charts["scatter"] = _to_png_b64(fig3)
-    else:
-        charts["scatter"] = ""
-
-    fig4 = plt.figure()
-    plt.plot(df["Date"], df["AI_Quality_Index"], marker="o", linestyle="-")
-    if x_roll is not None:
-        plt.plot(x_roll, roll_qi, linestyle="--")
-    plt.title("AI Quality Index over Time")
-    plt.xlabel("Date")
-    plt.ylabel("AI_Quality_Index (0-1)")
-    plt.grid(True, alpha=0.3)
-    charts["qi"] = _to_png_b64(fig4)
+        charts["scatter"] = _render_scatter(
+            chart_format, df["LinesAdded"], df["SurvivalRate"],
+            "Churn Correlation: LinesAdded vs SurvivalRate", "LinesAdded per Commit", "SurvivalRate (0-1)",
+        )
+    charts["qi"] = _render_linechart(
+        chart_format, df["Date"], df["AI_Quality_Index"], x_roll, roll_qi,
+        "AI Quality Index over Time", "Date", "AI_Quality_Index (0-1)",
+    )
 
     total_commits = len(df)
     total_lines = int(df["LinesAdded"].fillna(0).sum()) if "LinesAdded" in df.columns else 0
-    overall_sr = float(df["SurvivalRate"].replace([np.inf, -np.inf], np.nan).mean()) if len(df) else 0.0
-    if "ImmediateReworkRate" in df.columns:
-        overall_ir = float(df["ImmediateReworkRate"].replace([np.inf, -np.inf], np.nan).mean())
-    else:
-        overall_ir = float("nan")
-
-    rows_html = []
-    for _, r in df.iterrows():
-        date_str = r["Date"].strftime("%Y-%m-%d %H:%M") if pd.notna(r["Date"]) else ""
-        files = int(r.get("FilesTouched", 0)) if not pd.isna(r.get("FilesTouched", np.nan)) else 0
-        lines = int(r.get("LinesAdded", 0)) if not pd.isna(r.get("LinesAdded", np.nan)) else 0
-        surv = _format_float(r["SurvivalRate"])
-        immd = _format_float(r["ImmediateReworkRate"])
-        qi = _format_float(r["AI_Quality_Index"])
-        row = (
-            "<tr>"
-            f"<td>{html_module.escape(date_str)}</td>"
-            f"<td>{html_module.escape(str(files))}</td>"
-            f"<td>{html_module.escape(str(lines))}</td>"
-            f"<td>{html_module.escape(surv)}</td>"
-            f"<td>{html_module.escape(immd)}</td>"
-            f"<td>{html_module.escape(qi)}</td>"
-            "</tr>"
-        )
-        rows_html.append(row)
+    overall_sr = _finite_mean(sr) if len(df) else 0.0
+    overall_ir = _finite_mean(ir)
+
+    # Every cell is produced by strftime, int formatting or "%.3f", so none can
+    # contain HTML-special characters and the rows are assembled unescaped.
+    dates = df["Date"].dt.strftime("%Y-%m-%d %H:%M").fillna("")
+    zeros = pd.Series(0, index=df.index)
+    files = df.get("FilesTouched", zeros).fillna(0).astype(int).astype(str)
+    lines = df.get("LinesAdded", zeros).fillna(0).astype(int).astype(str)
+    surv = _fmt3(df["SurvivalRate"])
+    immd = _fmt3(df["ImmediateReworkRate"])
+    qi = _fmt3(df["AI_Quality_Index"])
+    rows_html = [
+        f"<tr><td>{d}</td><td>{f}</td><td>{l}</td><td>{s}</td><td>{i}</td><td>{q}</td></tr>"
+        for d, f, l, s, i, q in zip(dates, files, lines, surv, immd, qi)
+    ]
 
     return {
-        "label": label,
-        "source": os.path.basename(csv_path),
         "charts": charts,
         "kpi": {
             "commits": str(total_commits),
@@ -199,39 +537,7 @@ def _prepare_dataset(label, csv_path):
     }
 
 
-def build_dashboard(csv_path="ai_acceptance_metrics.csv", html_out="ai_acceptance_dashboard.html", datasets=None):
-    dataset_specs = _normalize_dataset_specs(csv_path, datasets)
-    if not dataset_specs:
-        raise ValueError("At least one dataset must be provided.")
-
-    repo_payloads = {}
-    option_tags = []
-    used_ids = set()
-    default_repo_id = None
-
-    for idx, (label, path) in enumerate(dataset_specs, start=1):
-        payload = _prepare_dataset(label, path)
-        repo_id = _unique_id(_slugify(label), used_ids, idx)
-        payload["id"] = repo_id
-        repo_payloads[repo_id] = payload
-        if default_repo_id is None:
-            default_repo_id = repo_id
-        selected_attr = " selected" if repo_id == default_repo_id else ""
-        option_tags.append(f'<option value="{repo_id}"{selected_attr}>{html_module.escape(label)}</option>')
-
-    initial_payload = repo_payloads[default_repo_id]
-    options_html = "\n      ".join(option_tags)
-    repo_data_json = json.dumps(repo_payloads).replace("</", "<\\/")
-
-    initial_repo_label = html_module.escape(initial_payload["label"])
-    initial_repo_source = html_module.escape(initial_payload["source"])
-    initial_kpi = initial_payload["kpi"]
-    initial_table_rows = initial_payload["tableRows"]
-    scatter_src = initial_payload["charts"].get("scatter", "")
-    scatter_img_extra_class = "" if scatter_src else " hidden"
-    scatter_empty_class_attr = ' class="hidden"' if scatter_src else ""
-
-    html_template = Template("""<!DOCTYPE html>
+_HTML_TEMPLATE = Template("""<!DOCTYPE html>
 <html>
 <head>
 <meta charset="utf-8" />
@@ -250,7 +556,8 @@ h1 { margin-bottom: 0; }
 .kpi .item { background: #fafafa; border: 1px solid #eee; border-radius: 10px; padding: 12px; }
 .kpi .item .label { color: #666; font-size: 12px; }
 .kpi .item .value { font-size: 20px; font-weight: 600; }
-img.chart { width: 100%; height: auto; border: 1px solid #eee; border-radius: 8px; }
+.chart { display: block; width: 100%; height: auto; border: 1px solid #eee; border-radius: 8px; }
+svg.chart { font-family: inherit; }
 table { border-collapse: collapse; width: 100%; }
 th, td { border: 1px solid #eee; padding: 8px; text-align: left; }
 th.sortable:hover { background: #f5f5f5; cursor: pointer; }
@@ -260,6 +567,7 @@ small { color: #666; }
 .repo-switcher select { padding: 6px 8px; border-radius: 6px; border: 1px solid #ccc; min-width: 200px; }
 .repo-switcher button { padding: 6px 12px; border-radius: 6px; border: 1px solid #ccc; background: #fff; cursor: pointer; }
 .repo-switcher button:hover { background: #f5f5f5; }
+.repo-status { color: #a33; }
 .hidden { display: none !important; }
 </style>
 </head>
@@ -275,6 +583,7 @@ small { color: #666; }
     </select>
     <button id="repoApply" type="button">Load metrics</button>
   </div>
+  <div id="repoStatus" class="repo-status hidden" role="status"></div>
 </div>
 
 <div class="kpi">
@@ -293,24 +602,24 @@ small { color: #666; }
 </div>
 
 <div id="t1" class="tab active">
-  <div class="card"><img id="chart-survival" class="chart" src="${chart_survival}" alt="Survival over Time" /></div>
+  <div class="card"><div id="chart-survival">${chart_survival}</div></div>
   <small>Solid line = per-commit; dashed = 7-day rolling mean.</small>
 </div>
 
 <div id="t2" class="tab">
-  <div class="card"><img id="chart-immediate" class="chart" src="${chart_immediate}" alt="Immediate Rework Rate over Time" /></div>
+  <div class="card"><div id="chart-immediate">${chart_immediate}</div></div>
   <small>Dashed = 7-day rolling mean.</small>
 </div>
 
 <div id="t3" class="tab">
   <div class="card">
-    <img id="chart-scatter" class="chart${scatter_img_extra_class}" src="${chart_scatter}" alt="LinesAdded vs SurvivalRate" />
+    <div id="chart-scatter"${scatter_frame_class_attr}>${chart_scatter}</div>
     <em id="scatter-empty"${scatter_empty_class_attr}>No LinesAdded column available.</em>
   </div>
 </div>
 
 <div id="t4" class="tab">
-  <div class="card"><img id="chart-qi" class="chart" src="${chart_qi}" alt="AI Quality Index over Time" /></div>
+  <div class="card"><div id="chart-qi">${chart_qi}</div></div>
   <small>AI_Quality_Index = SurvivalRate * (1 - ImmediateReworkRate)</small>
 </div>
 
@@ -335,9 +644,28 @@ small { color: #666; }
   <small>Click column headers to sort ascending/descending.</small>
 </div>
 
+<script type="application/octet-stream" id="repo-data">${repo_data_blob}</script>
 <script>
-const REPO_DATA = ${repo_data_json};
+async function loadRepoData() {
+  if (typeof DecompressionStream === 'undefined') {
+    throw new Error('this browser does not support DecompressionStream');
+  }
+  const encoded = document.getElementById('repo-data').textContent.trim();
+  const bytes = Uint8Array.from(atob(encoded), c => c.charCodeAt(0));
+  const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+  return new Response(stream).json();
+}
+// Decoded on first use only; the default repo is already rendered server-side.
+let repoData = null;
+function getRepoData() {
+  if (!repoData) {
+    repoData = loadRepoData();
+    repoData.catch(() => { repoData = null; });
+  }
+  return repoData;
+}
 const DEFAULT_REPO = "${default_repo_id}";
+const CHARTS_URL = ${charts_url_json};
 document.querySelectorAll('.tab-btn').forEach(btn => {
   btn.addEventListener('click', () => {
     document.querySelectorAll('.tab-btn').forEach(b => b.classList.remove('active'));
@@ -379,17 +707,62 @@ document.querySelectorAll('.tab-btn').forEach(btn => {
   const repoName = document.getElementById('repoName');
   const repoSource = document.getElementById('repoSource');
   const tableBody = document.getElementById('data-body');
-  const scatterImg = document.getElementById('chart-scatter');
+  const scatterFrame = document.getElementById('chart-scatter');
   const scatterEmpty = document.getElementById('scatter-empty');
+  const repoStatus = document.getElementById('repoStatus');
   const kpis = {
     commits: document.getElementById('kpi-commits'),
     lines: document.getElementById('kpi-lines'),
     survival: document.getElementById('kpi-survival'),
     immediate: document.getElementById('kpi-immediate')
   };
-  function renderRepo(repoId) {
-    const data = REPO_DATA[repoId];
-    if (!data) {
+  let chartsRequest = null;
+  let currentRepo = DEFAULT_REPO;
+  function loadCharts(repoId, data) {
+    if (data.charts || !CHARTS_URL) {
+      return Promise.resolve(data.charts || {});
+    }
+    if (!chartsRequest) {
+      chartsRequest = fetch(CHARTS_URL).then(response => {
+        if (!response.ok) {
+          throw new Error('Failed to load ' + CHARTS_URL + ': ' + response.status);
+        }
+        return response.json();
+      });
+      chartsRequest.catch(() => { chartsRequest = null; });
+    }
+    return chartsRequest.then(all => all[repoId] || {});
+  }
+  function showStatus(message) {
+    repoStatus.textContent = message || "";
+    repoStatus.classList.toggle('hidden', !message);
+  }
+  function setCharts(charts) {
+    document.getElementById('chart-survival').innerHTML = charts.survival || "";
+    document.getElementById('chart-immediate').innerHTML = charts.immediate || "";
+    document.getElementById('chart-qi').innerHTML = charts.qi || "";
+    if ('scatter' in charts) {
+      scatterFrame.innerHTML = charts.scatter;
+      scatterFrame.classList.remove('hidden');
+      scatterEmpty.classList.add('hidden');
+    } else {
+      scatterFrame.innerHTML = "";
+      scatterFrame.classList.add('hidden');
+      scatterEmpty.classList.toggle('hidden', charts.unavailable === true);
+    }
+  }
+  async function renderRepo(repoId) {
+    currentRepo = repoId;
+    let data;
+    try {
+      data = (await getRepoData())[repoId];
+    } catch (error) {
+      if (currentRepo === repoId) {
+        showStatus('Repository data unavailable: ' + error.message + '.');
+      }
+      return;
+    }
+    if (!data || currentRepo !== repoId) {
       return;
     }
     repoName.textContent = data.label;
@@ -398,18 +771,24 @@ document.querySelectorAll('.tab-btn').forEach(btn => {
     kpis.lines.textContent = data.kpi.lines;
     kpis.survival.textContent = data.kpi.survival;
     kpis.immediate.textContent = data.kpi.immediate;
-    document.getElementById('chart-survival').src = data.charts.survival;
-    document.getElementById('chart-immediate').src = data.charts.immediate;
-    document.getElementById('chart-qi').src = data.charts.qi;
-    if (data.charts.scatter) {
-      scatterImg.src = data.charts.scatter;
-      scatterImg.classList.remove('hidden');
-      scatterEmpty.classList.add('hidden');
-    } else {
-      scatterImg.classList.add('hidden');
-      scatterEmpty.classList.remove('hidden');
-    }
     tableBody.innerHTML = data.tableRows || "";
+    let charts;
+    try {
+      charts = await loadCharts(repoId, data);
+    } catch (error) {
+      if (currentRepo !== repoId) {
+        return;
+      }
+      // Never leave the previous repo's charts next to this repo's numbers.
+      setCharts({ unavailable: true });
+      showStatus('Charts unavailable: ' + error.message + ' (serve the report over HTTP to load ' + CHARTS_URL + ').');
+      return;
+    }
+    if (currentRepo !== repoId) {
+      return;
+    }
+    showStatus("");
+    setCharts(charts);
   }
   repoApply.addEventListener('click', () => renderRepo(repoSelect.value));
   repoSelect.addEventListener('keypress', (event) => {
@@ -418,17 +797,93 @@ document.querySelectorAll('.tab-btn').forEach(btn => {
       renderRepo(repoSelect.value);
     }
   });
-  if (DEFAULT_REPO in REPO_DATA) {
-    repoSelect.value = DEFAULT_REPO;
-    renderRepo(DEFAULT_REPO);
-  }
+  // The default repo is already rendered server-side; just sync the selector.
+  repoSelect.value = DEFAULT_REPO;
 })();
 </script>
 
 </body>
 </html>""")
 
-    html_content = html_template.substitute(
+
+def build_dashboard(csv_path="ai_acceptance_metrics.csv", html_out="ai_acceptance_dashboard.html", datasets=None, use_cache=True, chart_format="svg", charts_sidecar=False):
+    if chart_format not in CHART_FORMATS:
+        raise ValueError(f"Unsupported chart format: {chart_format}")
+    dataset_specs = _normalize_dataset_specs(csv_path, datasets)
+    if not dataset_specs:
+        raise ValueError("At least one dataset must be provided.")
+
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(html_out)), _DATASET_CACHE_SUBDIR) if use_cache else None
+    labels = [label for label, _ in dataset_specs]
+    paths = [path for _, path in dataset_specs]
+
+    # Cache hits are resolved here; only misses are worth a worker process.
+    payloads = [None] * len(dataset_specs)
+    misses = []
+    for index, path in enumerate(paths):
+        cache_path, payload = _lookup_dataset(path, cache_dir, chart_format)
+        if payload is None:
+            misses.append((index, path, cache_path))
+        else:
+            payloads[index] = payload
+
+    render = partial(_render_and_cache_dataset, chart_format=chart_format)
+    miss_paths = [path for _, path, _ in misses]
+    miss_cache_paths = [cache_path for _, _, cache_path in misses]
+    max_workers = min(len(misses), os.cpu_count() or 1)
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            rendered = list(executor.map(render, miss_paths, miss_cache_paths))
+    else:
+        rendered = [render(path, cache_path) for path, cache_path in zip(miss_paths, miss_cache_paths)]
+    for (index, _, _), payload in zip(misses, rendered):
+        payloads[index] = payload
+    payloads = [_labelled_payload(label, path, payload) for label, path, payload in zip(labels, paths, payloads)]
+    if cache_dir:
+        _prune_dataset_cache(cache_dir, max(_DATASET_CACHE_MAX_ENTRIES, len(dataset_specs)))
+
+    repo_payloads = {}
+    option_tags = []
+    used_ids = set()
+    id_counters = defaultdict(int)
+    default_repo_id = None
+
+    for idx, (label, payload) in enumerate(zip(labels, payloads), start=1):
+        repo_id = _unique_id(_slugify(label), used_ids, id_counters, idx)
+        payload["id"] = repo_id
+        repo_payloads[repo_id] = payload
+        if default_repo_id is None:
+            default_repo_id = repo_id
+        selected_attr = " selected" if repo_id == default_repo_id else ""
+        option_tags.append(f'<option value="{repo_id}"{selected_attr}>{html_module.escape(label)}</option>')
+
+    initial_payload = repo_payloads[default_repo_id]
+    initial_charts = initial_payload["charts"]
+    options_html = "\n      ".join(option_tags)
+
+    charts_url = None
+    if charts_sidecar:
+        charts_out = f"{os.path.splitext(html_out)[0]}.charts.json"
+        charts_by_repo = {repo_id: payload.pop("charts") for repo_id, payload in repo_payloads.items()}
+        with open(charts_out, "w", encoding="utf-8") as f:
+            json.dump(charts_by_repo, f)
+        charts_url = os.path.basename(charts_out)
+    # Gzipped JSON, base64-encoded: the SVG markup and table rows compress very
+    # well, and the base64 alphabet can never close the enclosing <script> early.
+    repo_data_blob = base64.b64encode(
+        gzip.compress(json.dumps(repo_payloads).encode("utf-8"), compresslevel=6, mtime=0)
+    ).decode("ascii")
+    charts_url_json = json.dumps(charts_url).replace("</", "<\\/")
+
+    initial_repo_label = html_module.escape(initial_payload["label"])
+    initial_repo_source = html_module.escape(initial_payload["source"])
+    initial_kpi = initial_payload["kpi"]
+    initial_table_rows = initial_payload["tableRows"]
+    has_scatter = "scatter" in initial_charts
+    scatter_frame_class_attr = "" if has_scatter else ' class="hidden"'
+    scatter_empty_class_attr = ' class="hidden"' if has_scatter else ""
+
+    html_content = _HTML_TEMPLATE.substitute(
         initial_repo_label=initial_repo_label,
         initial_repo_source=initial_repo_source,
         options_html=options_html,
@@ -436,14 +891,15 @@ document.querySelectorAll('.tab-btn').forEach(btn => {
         initial_kpi_lines=initial_kpi["lines"],
         initial_kpi_survival=initial_kpi["survival"],
         initial_kpi_immediate=initial_kpi["immediate"],
-        chart_survival=initial_payload["charts"]["survival"],
-        chart_immediate=initial_payload["charts"]["immediate"],
-        chart_scatter=scatter_src,
-        scatter_img_extra_class=scatter_img_extra_class,
+        chart_survival=initial_charts["survival"],
+        chart_immediate=initial_charts["immediate"],
+        chart_scatter=initial_charts.get("scatter", ""),
+        scatter_frame_class_attr=scatter_frame_class_attr,
         scatter_empty_class_attr=scatter_empty_class_attr,
-        chart_qi=initial_payload["charts"]["qi"],
+        chart_qi=initial_charts["qi"],
         initial_table_rows=initial_table_rows,
-        repo_data_json=repo_data_json,
+        repo_data_blob=repo_data_blob,
+        charts_url_json=charts_url_json,
         default_repo_id=default_repo_id,
     )
 
@@ -457,6 +913,16 @@ if __name__ == "__main__":
     parser.add_argument("--csv", dest="csv_path", default="ai_acceptance_metrics.csv", help="Path to a CSV file (used when --dataset is omitted).")
     parser.add_argument("--out", dest="html_out", default="ai_acceptance_dashboard.html", help="Destination HTML report path.")
     parser.add_argument("--dataset", action="append", help="Repeatable 'Display Name=path/to.csv' entries to embed multiple repos.")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false", help=f"Re-render every dataset instead of reusing cached payloads from .cache/dashboard/ next to the --out file (the {_DATASET_CACHE_MAX_ENTRIES} most recently used entries are kept).")
+    parser.add_argument("--chart-format", choices=CHART_FORMATS, default="svg", help="Inline vector SVG charts (default) or matplotlib-rendered WebP/PNG images.")
+    parser.add_argument("--charts-sidecar", action="store_true", help="Write chart markup to <out>.charts.json and fetch it on demand instead of inlining it (requires serving over HTTP).")
     args = parser.parse_args()
-    output_path = build_dashboard(csv_path=args.csv_path, html_out=args.html_out, datasets=args.dataset)
+    output_path = build_dashboard(
+        csv_path=args.csv_path,
+        html_out=args.html_out,
+        datasets=args.dataset,
+        use_cache=args.use_cache,
+        chart_format=args.chart_format,
+        charts_sidecar=args.charts_sidecar,
+    )
     print(output_path)